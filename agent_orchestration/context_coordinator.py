@@ -9,10 +9,11 @@ import time
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime
-import openai
 from dotenv import load_dotenv
 import os
 
+from openai_client import get_openai_client
+
 load_dotenv()
 
 @dataclass
@@ -63,7 +64,7 @@ class ReviewAgentCoordinator:
     """Coordinates multiple AI agents for VR game review analysis"""
     
     def __init__(self):
-        self.openai_client = openai.OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+        self.openai_client = get_openai_client()
         
         # Initialize agent budgets ($0.20 total per review)
         self.agent_budgets = {
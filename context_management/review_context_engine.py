@@ -9,10 +9,11 @@ import hashlib
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 from datetime import datetime
-import openai
 from dotenv import load_dotenv
 import os
 
+from openai_client import get_openai_client
+
 load_dotenv()
 
 @dataclass
@@ -100,7 +101,7 @@ class ReviewContextEngine:
         self.audience_growth_context = ContextWindow(100_000, context_type="audience_growth")
         self.safety_monitoring_context = ContextWindow(50_000, context_type="safety")
         
-        self.openai_client = openai.OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+        self.openai_client = get_openai_client()
         
         # Learning memory for pattern recognition
         self.successful_patterns = self._load_successful_patterns()
@@ -0,0 +1,20 @@
+"""
+Shared OpenAI Client
+One client per process so every analysis system reuses the same HTTP connection pool
+"""
+
+import os
+import threading
+
+import openai
+
+_shared_openai_client = None
+_shared_openai_client_lock = threading.Lock()
+
+def get_openai_client() -> openai.OpenAI:
+    """Get the process-wide OpenAI client"""
+    global _shared_openai_client
+    with _shared_openai_client_lock:
+        if _shared_openai_client is None:
+            _shared_openai_client = openai.OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+        return _shared_openai_client
@@ -9,10 +9,11 @@ import re
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
-import openai
 from dotenv import load_dotenv
 import os
 
+from openai_client import get_openai_client
+
 load_dotenv()
 
 @dataclass
@@ -81,7 +82,7 @@ class ReviewQualityAssessor:
     """Comprehensive VR game review quality assessment system"""
     
     def __init__(self):
-        self.openai_client = openai.OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+        self.openai_client = get_openai_client()
         
         # Essential topics that VR game reviews should cover
         self.essential_vr_topics = [
@@ -5,11 +5,30 @@ Young reviewer-friendly Flask application with game research tools
 
 print("Starting VR Game Review Studio Web Interface...")
 
-from flask import Flask, render_template, request, jsonify, redirect, url_for, session, flash
+from flask import Flask, Request, render_template, send_file, send_from_directory, request, redirect, url_for, session, flash, g
 import os
+import io
+import tempfile
+import sqlite3
+import contextlib
+import concurrent.futures
+import mimetypes
+import mmap
+from urllib.parse import quote
 import json
-from datetime import datetime, timedelta
+import functools
+import math
+import collections
+import heapq
+import threading
+import time
+import secrets
+from datetime import datetime, timedelta, timezone
 from werkzeug.utils import secure_filename
+from jinja2 import FileSystemBytecodeCache
+import numpy as np
+
+from env_flags import env_bool
 
 try:
     import asyncio
@@ -17,6 +36,21 @@ except ImportError:
     print("Warning: asyncio not available")
     asyncio = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # Windows: only threads in one process are serialized
+
 print(f"Current working directory: {os.getcwd()}")
 print(f"Environment variables: FLASK_DEBUG={os.getenv('FLASK_DEBUG')}, RENDER={os.getenv('RENDER')}")
 
@@ -26,7 +60,7 @@ IS_PRODUCTION = (
     os.getenv('RENDER') is not None or 
     os.getenv('RENDER_SERVICE_NAME') is not None or
     os.getenv('PORT') is not None or
-    os.getenv('FLASK_DEBUG', 'True').lower() == 'false'
+    not env_bool('FLASK_DEBUG', True)
 )
 print(f"IS_PRODUCTION: {IS_PRODUCTION}")
 print(f"RENDER env: {os.getenv('RENDER')}")
@@ -51,6 +85,36 @@ class MockEngine:
     async def comprehensive_quality_analysis(self, *args):
         return {"status": "demo_mode"}
 
+class LocalCache:
+    """In-process stand-in for the Redis commands the app uses (per worker process)"""
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self._data = collections.OrderedDict()  # least recently used first
+        self._lock = threading.Lock()
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+    def setex(self, key, seconds, value):
+        if isinstance(value, str):
+            value = value.encode('utf-8')  # Redis hands back bytes
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + seconds)
+            self._data.move_to_end(key)
+            # Live entries count too, so evict the least recently used beyond the limit
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+    def delete(self, *keys):
+        with self._lock:
+            return sum(1 for key in keys if self._data.pop(key, None) is not None)
+
 ReviewContextEngine = MockEngine
 ReviewAgentCoordinator = MockEngine
 VRGameKnowledgeCompressor = MockEngine  
@@ -59,6 +123,55 @@ ReviewQualityAssessor = MockEngine
 app = Flask(__name__)
 app.secret_key = os.getenv('FLASK_SECRET_KEY', 'vr_review_studio_secret_key_for_young_reviewer')
 
+# JSON encoding goes through orjson when installed
+def dumps_json(obj, indent=False):
+    """Serialize an object to JSON bytes"""
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=str, option=option)
+    return json.dumps(obj, indent=2 if indent else None, default=str).encode('utf-8')
+
+def loads_json(data):
+    """Parse JSON from bytes or str"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def load_json_file(path):
+    """Read and parse a JSON file as bytes"""
+    with open(path, 'rb') as f:
+        return loads_json(f.read())
+
+def json_response(obj):
+    """Build a JSON response without going through jsonify"""
+    return app.response_class(dumps_json(obj), mimetype='application/json')
+
+# Mode that open() would give a new file; mkstemp-style spool files start as 0600.
+# os.umask can only be read by setting it, so do it once while still single-threaded
+_process_umask = os.umask(0)
+os.umask(_process_umask)
+UPLOADED_FILE_MODE = 0o666 & ~_process_umask
+
+class UploadRequest(Request):
+    """Request that spools large uploads straight into the upload folder"""
+    
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        if total_content_length is not None and total_content_length <= CONFIG['UPLOAD_SPOOL_THRESHOLD']:
+            return io.BytesIO()
+        
+        # A named file on the upload volume can be renamed into place instead of copied
+        spool_file = tempfile.NamedTemporaryFile('wb+', dir=CONFIG['UPLOAD_FOLDER'],
+                                                 prefix='.upload-', suffix='.part', delete=False)
+        # The file keeps its mode when renamed into place, so match file.save() uploads
+        # (nginx serving X-Accel downloads as another user needs to read it)
+        os.chmod(spool_file.name, UPLOADED_FILE_MODE)
+        g.setdefault('upload_spool_files', []).append(spool_file.name)
+        return spool_file
+
+app.request_class = UploadRequest
+
 # Configuration
 if IS_PRODUCTION:
     project_root = '/app'  # Render default app directory
@@ -70,18 +183,44 @@ else:
 
 # Create a dedicated video uploads folder
 VIDEO_UPLOADS_DIR = os.path.join(project_root, 'video_uploads')
-VIDEO_DATABASE_FILE = os.path.join(project_root, 'video_database.json')
+LEGACY_VIDEO_DATABASE_FILE = os.path.join(project_root, 'video_database.json')
 
 CONFIG = {
     'UPLOAD_FOLDER': '/tmp/uploads' if IS_PRODUCTION else VIDEO_UPLOADS_DIR,
     'MAX_CONTENT_LENGTH': 500 * 1024 * 1024,  # 500MB max file size
     'ALLOWED_EXTENSIONS': {'mp4', 'mov', 'avi', 'mkv'},
     'PROJECT_ROOT': project_root,
-    'VIDEO_DATABASE': VIDEO_DATABASE_FILE
+    'LEGACY_VIDEO_DATABASE': LEGACY_VIDEO_DATABASE_FILE,
+    'UPLOAD_SPOOL_THRESHOLD': 500 * 1024,  # uploads larger than this are spooled to disk
+    'UPLOAD_MAX_CHUNK_SIZE': 10 * 1024 * 1024,  # largest accepted resumable upload chunk
+    'UPLOAD_COPY_BUFFER_SIZE': 1024 * 1024,  # per-thread buffer for writing upload chunks
+    'UPLOAD_STALE_AFTER': 24 * 60 * 60,  # seconds without a chunk before a resumable upload is discarded
+    'PROCESSING_TIMEOUT': int(os.getenv('UPLOAD_PROCESSING_TIMEOUT', 300)),  # seconds
+    'REVIEW_JOB_TIMEOUT': int(os.getenv('REVIEW_JOB_TIMEOUT', 1800)),  # seconds
+    'REDIS_URL': os.getenv('REDIS_URL'),
+    'VIDEO_STREAM_MAX_AGE': 3600,  # seconds browsers may reuse a streamed video without revalidating
+    'X_ACCEL_REDIRECT_PREFIX': os.getenv('X_ACCEL_REDIRECT_PREFIX'),  # internal nginx location for uploads
+    'GAME_INDEX_TTL': 300,  # seconds before the game search index is rebuilt
+    'GAME_INFO_CACHE_TTL': 24 * 60 * 60,  # seconds
+    'GAME_DATABASE_CACHE_TTL': 300,  # seconds
+    'RECENT_REVIEWS_INDEX_MAX': 128,  # entries before the recent reviews index is compacted
+    'RECENT_REVIEWS_INDEX_KEEP': 64  # entries kept after compaction
 }
 
 app.config.update(CONFIG)
 
+# Templates only change on deploy in production, so skip the per-render stat
+if IS_PRODUCTION:
+    app.config['TEMPLATES_AUTO_RELOAD'] = False
+
+# Share compiled templates across workers and restarts (keyed on the source checksum).
+# Without a directory argument Jinja uses a per-user 0700 temp directory and checks
+# its owner and mode, so other local users cannot plant bytecode in it
+try:
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
+except (OSError, RuntimeError) as e:
+    print(f"Template bytecode cache disabled: {e}")
+
 # Ensure upload directory exists
 try:
     os.makedirs(CONFIG['UPLOAD_FOLDER'], exist_ok=True)
@@ -91,23 +230,160 @@ except (PermissionError, OSError) as e:
     if not IS_PRODUCTION:
         raise
 
-# Initialize systems with fallback
-try:
-    context_engine = ReviewContextEngine()
-    agent_coordinator = ReviewAgentCoordinator()
-    game_compressor = VRGameKnowledgeCompressor()
-    quality_assessor = ReviewQualityAssessor()
-    print("🤖 AI analysis systems initialized")
-except Exception as e:
-    print(f"AI systems in demo mode: {e}")
-    context_engine = ReviewContextEngine()
-    agent_coordinator = ReviewAgentCoordinator()
-    game_compressor = VRGameKnowledgeCompressor()
-    quality_assessor = ReviewQualityAssessor()
+# Analysis systems are process-wide singletons: request handlers must reuse
+# them (and the HTTP clients they hold) rather than constructing new instances
+# per request. They are built on first use so CLI commands like `flask routes`
+# don't pay their startup cost.
+context_engine = None
+agent_coordinator = None
+game_compressor = None
+quality_assessor = None
+_systems_ready = False
+_systems_lock = threading.Lock()
+
+def _safe_system(cls):
+    """Build one analysis system, falling back to demo mode if it cannot start"""
+    try:
+        return cls()
+    except Exception as e:
+        print(f"{cls.__name__} in demo mode: {e}")
+        return MockEngine()
+
+def init_systems():
+    """Initialize the analysis systems once per process, with fallback"""
+    global context_engine, agent_coordinator, game_compressor, quality_assessor, _systems_ready
+    if _systems_ready:
+        return
+    
+    with _systems_lock:
+        if _systems_ready:
+            return
+        
+        # Each system falls back on its own, so one failure does not rebuild the others
+        context_engine = _safe_system(ReviewContextEngine)
+        agent_coordinator = _safe_system(ReviewAgentCoordinator)
+        game_compressor = _safe_system(VRGameKnowledgeCompressor)
+        quality_assessor = _safe_system(ReviewQualityAssessor)
+        print("🤖 AI analysis systems initialized")
+        
+        _systems_ready = True
+
+# Background job queue (only when Redis is configured); redis and rq are
+# imported here so deployments without Redis don't load them at startup
+redis_client = None
+review_queue = None
+if CONFIG['REDIS_URL']:
+    try:
+        import redis
+        from rq import Queue
+        
+        redis_client = redis.Redis.from_url(CONFIG['REDIS_URL'])
+        redis_client.ping()
+        review_queue = Queue('reviews', connection=redis_client)
+        print("📬 Background review queue connected")
+    except ImportError:
+        print("Warning: redis/rq not installed, processing reviews inline")
+    except Exception as e:
+        print(f"Redis unavailable, processing reviews inline: {e}")
+        redis_client = None
+        review_queue = None
+
+# Cache for rarely-changing game data; falls back to process memory without Redis
+cache_client = redis_client if redis_client is not None else LocalCache()
+# Errors that mean the cache is unavailable rather than a bug in the caller
+CACHE_ERRORS = (redis.exceptions.RedisError, OSError) if redis_client is not None else (OSError,)
+
+# Shared event loop for the async analysis systems, started on first use so
+# every worker process gets its own loop thread
+_background_loop = None
+_background_loop_lock = threading.Lock()
+
+def get_background_loop():
+    """Get the long-lived event loop that runs analysis coroutines"""
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None:
+            _background_loop = asyncio.new_event_loop()
+            threading.Thread(target=_background_loop.run_forever,
+                             name='review-analysis-loop', daemon=True).start()
+    return _background_loop
+
+def run_async(coro, timeout=None):
+    """Run a coroutine on the shared background loop and wait for its result"""
+    future = asyncio.run_coroutine_threadsafe(coro, get_background_loop())
+    try:
+        return future.result(timeout=timeout)
+    except TimeoutError:
+        future.cancel()
+        raise
+
+async def analyze_review_video(filepath, game_info):
+    """Run context, agent and quality analysis for an uploaded review"""
+    async def agent_then_quality():
+        # Quality assessment only depends on the agent consensus
+        agent_result = await agent_coordinator.competitive_review_analysis(filepath, game_info)
+        quality_result = await quality_assessor.comprehensive_quality_analysis(filepath, game_info, agent_result)
+        return agent_result, quality_result
+    
+    # Context analysis is independent and overlaps the agent/quality chain
+    context_result, (agent_result, quality_result) = await asyncio.gather(
+        context_engine.analyze_vr_game_review_with_isolation(filepath, game_info),
+        agent_then_quality()
+    )
+    return context_result, agent_result, quality_result
+
+def run_review_pipeline(filepath, game_info):
+    """Analyze a review video and store the results (background job entry point)"""
+    init_systems()
+    analyses = asyncio.run(analyze_review_video(filepath, game_info))
+    return combine_review_results(filepath, game_info, *analyses)
+
+def combine_review_results(filepath, game_info, context_result, agent_result, quality_result):
+    """Combine the analysis results for a review and store them"""
+    combined_result = {
+        'status': 'complete',
+        'context_analysis': context_result,
+        'agent_consensus': agent_result,
+        'quality_assessment': quality_result,
+        'processing_timestamp': datetime.now().isoformat(),
+        'game_info': game_info,
+        'filepath': filepath
+    }
+    
+    # Store results
+    combined_result['analysis_id'] = store_analysis_results(combined_result)
+    
+    return combined_result
+
+def enqueue_review(filepath, game_info):
+    """Queue a review video for background analysis and return the job ID"""
+    # By dotted path: under `python3 app.py` the function would be recorded as
+    # __main__.run_review_pipeline, which the rq worker (run in web_interface/) cannot import
+    job = review_queue.enqueue('app.run_review_pipeline', filepath, game_info,
+                               job_timeout=CONFIG['REVIEW_JOB_TIMEOUT'])
+    return job.id
+
+ALLOWED_SUFFIXES = tuple(f".{ext}" for ext in CONFIG['ALLOWED_EXTENSIONS'])
 
 def allowed_file(filename):
     """Check if uploaded file is allowed"""
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in CONFIG['ALLOWED_EXTENSIONS']
+    return filename.lower().endswith(ALLOWED_SUFFIXES)
+
+@app.before_request
+def ensure_systems_initialized():
+    """Build the analysis systems before the first request is handled"""
+    init_systems()
+
+@app.teardown_request
+def remove_upload_spool_files(exc):
+    """Delete spooled uploads that were not moved into place"""
+    for spool_path in g.pop('upload_spool_files', ()):
+        try:
+            os.remove(spool_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Cannot remove upload spool file {spool_path}: {e}")
 
 @app.route('/')
 def dashboard():
@@ -140,30 +416,31 @@ def search_games():
     try:
         query = request.args.get('q', '').strip()
         if not query:
-            return jsonify({'games': []})
+            return json_response({'games': []})
         
-        # Search compressed game database
-        games = game_compressor.search_games_by_criteria()
-        
-        # Filter by search query
-        filtered_games = []
-        for game in games:
-            if query.lower() in game['name'].lower() or query.lower() in game['genre'].lower():
-                filtered_games.append(game)
+        # Search compressed game database through the trigram index,
+        # falling back to the closest names for misspelled queries
+        game_index = get_game_index()
+        filtered_games = game_index.search(query) or game_index.similar(query)
         
         # Add mock VR games if database is empty
         if not filtered_games:
             filtered_games = get_mock_vr_games(query)
         
-        return jsonify({'games': filtered_games[:10]})  # Top 10 results
+        return json_response({'games': filtered_games[:10]})  # Top 10 results
         
     except Exception as e:
-        return jsonify({'error': str(e), 'games': []})
+        return json_response({'error': str(e), 'games': []})
 
 @app.route('/api/game-info/<game_name>')
 def get_game_info(game_name):
     """Get detailed information about a specific VR game"""
     try:
+        cache_key = game_info_cache_key(game_name)
+        cached = cache_get(cache_key)
+        if cached is not None:
+            return app.response_class(cached, mimetype='application/json')
+        
         # Get from compressed database
         game_info = game_compressor.get_compressed_game_info(game_name)
         
@@ -171,10 +448,35 @@ def get_game_info(game_name):
             # Create mock game info for demonstration
             game_info = create_mock_game_info(game_name)
         
-        return jsonify({'game': game_info})
+        payload = dumps_json({'game': game_info})
+        cache_setex(cache_key, CONFIG['GAME_INFO_CACHE_TTL'], payload)
+        return app.response_class(payload, mimetype='application/json')
         
     except Exception as e:
-        return jsonify({'error': str(e), 'game': None})
+        return json_response({'error': str(e), 'game': None})
+
+@app.route('/admin/invalidate-game/<game_name>', methods=['POST'])
+def invalidate_game_info(game_name):
+    """Drop a cached game info entry so the next lookup refreshes it"""
+    try:
+        removed = cache_client.delete(game_info_cache_key(game_name))
+        # Without Redis every worker process keeps its own cache and only this one is cleared
+        return json_response({
+            'success': True,
+            'invalidated': bool(removed),
+            'scope': 'all_workers' if redis_client is not None else 'this_worker'
+        })
+    except Exception as e:
+        return json_response({'success': False, 'error': str(e)})
+
+@app.route('/admin/export-pretty/<analysis_id>')
+def export_pretty_analysis(analysis_id):
+    """Return a stored analysis result as indented JSON for inspection"""
+    analysis_result = load_analysis_results(analysis_id)
+    if analysis_result is None:
+        return json_response({'error': 'Analysis not found'}), 404
+    
+    return app.response_class(dumps_json(analysis_result, indent=True), mimetype='application/json')
 
 @app.route('/upload-review', methods=['GET', 'POST'])
 def upload_review():
@@ -202,44 +504,27 @@ def upload_review():
             return redirect(request.url)
         
         # Save uploaded file
-        filename = secure_filename(file.filename)
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        game_safe = secure_filename(request.form.get('game_name', 'Unknown'))
-        filename = f"{timestamp}_{game_safe}_{filename}"
-        filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(filepath)
-        
-        # Get game and review information
-        game_name = request.form.get('game_name', 'Unknown Game')
-        review_type = request.form.get('review_type', 'full-review')
-        
-        # Calculate file size
-        file_size = os.path.getsize(filepath)
-        
-        # Create video entry for database
-        video_entry = {
-            'id': f"{timestamp}_{game_safe}",
-            'filename': filename,
-            'filepath': filepath,
-            'game_name': game_name,
-            'review_type': review_type.replace('-', ' ').title(),
-            'upload_date': datetime.now().isoformat(),
-            'size': format_file_size(file_size),
-            'status': 'Processing',
-            'game_info': {
-                'name': game_name,
-                'genre': request.form.get('game_genre', 'Unknown'),
-                'platform': request.form.get('game_platform', 'VR'),
-                'price': float(request.form.get('game_price', 0)),
-                'rating': float(request.form.get('game_rating', 0))
-            }
-        }
-        
-        # Save to video database
-        save_video_to_database(video_entry)
+        video_entry = new_video_entry(file.filename, request.form)
+        filepath = video_entry['filepath']
+        spool_path = getattr(file.stream, 'name', None)
+        if isinstance(spool_path, str) and spool_path in g.get('upload_spool_files', ()):
+            # Already on the upload volume, so move it without copying the bytes
+            file.stream.flush()
+            os.replace(spool_path, filepath)
+        else:
+            file.save(filepath)
+        drop_page_cache(filepath)
         
-        # Start background processing
-        session['processing_video'] = video_entry
+        # Save to video database and start background processing
+        try:
+            register_uploaded_video(video_entry)
+        except Exception:
+            # Don't leave a file behind that no database entry points to
+            try:
+                os.remove(filepath)
+            except OSError:
+                pass
+            raise
         
         flash(f'Video uploaded successfully! Saved to: {CONFIG["UPLOAD_FOLDER"]}', 'success')
         return redirect(url_for('review_processing'))
@@ -248,10 +533,130 @@ def upload_review():
         flash(f'Upload error: {str(e)}', 'error')
         return redirect(request.url)
 
+@app.route('/upload-review/chunk', methods=['POST'])
+def start_chunked_upload():
+    """Start a resumable upload that is sent in Content-Range chunks"""
+    form = request.get_json(silent=True)
+    if form is None:
+        form = request.form.to_dict()
+    
+    # Reject bad metadata now rather than after every byte has been sent
+    try:
+        metadata = normalize_upload_metadata(form)
+    except ValueError as e:
+        return json_response({'success': False, 'error': str(e)}), 400
+    
+    if not allowed_file(metadata.get('filename', '')):
+        return json_response({'success': False, 'error': 'Invalid file type. Please upload MP4, MOV, AVI, or MKV files.'}), 400
+    
+    try:
+        total_size = int(form.get('total_size', 0))
+    except (TypeError, ValueError):
+        total_size = 0
+    if not 0 < total_size <= CONFIG['MAX_CONTENT_LENGTH']:
+        return json_response({'success': False, 'error': 'Invalid upload size'}), 400
+    
+    try:
+        expire_stale_uploads()
+    except Exception as e:
+        print(f"Cannot expire stale uploads: {e}")
+    
+    upload_id = secrets.token_urlsafe(16)
+    part_path = os.path.join(CONFIG['UPLOAD_FOLDER'], f".upload-{upload_id}.part")
+    try:
+        with open(part_path, 'wb'):
+            pass
+        with video_db() as conn:
+            conn.execute(
+                "INSERT INTO uploads (id, part_path, received, total_size, metadata_json, created) VALUES (?, ?, 0, ?, ?, ?)",
+                (upload_id, part_path, total_size, dumps_json(metadata).decode('utf-8'), datetime.now().isoformat())
+            )
+    except Exception as e:
+        print(f"Cannot start upload {upload_id}: {e}")
+        try:
+            os.remove(part_path)
+        except OSError:
+            pass
+        return json_response({'success': False, 'error': 'Could not start the upload'}), 500
+    
+    return json_response({'success': True, 'upload_id': upload_id, 'received': 0,
+                          'chunk_size': CONFIG['UPLOAD_MAX_CHUNK_SIZE']})
+
+@app.route('/upload-review/chunk/<upload_id>', methods=['GET'])
+def chunked_upload_status(upload_id):
+    """Report how many bytes of a resumable upload have arrived"""
+    upload = get_chunked_upload(upload_id)
+    if not upload:
+        return json_response({'success': False, 'error': 'Upload not found'}), 404
+    
+    return json_response({'success': True, 'upload_id': upload_id,
+                          'received': upload['received'], 'total_size': upload['total_size']})
+
+@app.route('/upload-review/chunk/<upload_id>', methods=['PUT'])
+def upload_review_chunk(upload_id):
+    """Write one chunk of a resumable upload and finalize it after the last chunk"""
+    upload = get_chunked_upload(upload_id)
+    if not upload:
+        return json_response({'success': False, 'error': 'Upload not found'}), 404
+    
+    content_range = parse_content_range(request.headers.get('Content-Range', ''))
+    if content_range is None or content_range[2] != upload['total_size']:
+        return json_response({'success': False, 'error': 'Invalid Content-Range'}), 400
+    
+    start, end, total_size = content_range
+    if start != upload['received']:
+        # Tell the client where to resume from
+        return json_response({'success': False, 'error': 'Unexpected chunk offset',
+                              'received': upload['received']}), 409
+    
+    chunk_length = end - start + 1
+    if chunk_length > CONFIG['UPLOAD_MAX_CHUNK_SIZE']:
+        return json_response({'success': False, 'error': 'Chunk too large'}), 413
+    
+    # Write at the expected offset so a retried chunk overwrites any partial attempt
+    written = 0
+    buffer = get_upload_buffer()
+    fd = os.open(upload['part_path'], os.O_WRONLY)
+    try:
+        while written < chunk_length:
+            size = read_into(request.stream, buffer[:min(len(buffer), chunk_length - written)])
+            if not size:
+                break
+            view = buffer[:size]
+            while view:
+                count = os.pwrite(fd, view, start + written)
+                written += count
+                view = view[count:]
+        advise_dont_cache(fd, start, written)
+    finally:
+        os.close(fd)
+    
+    if written != chunk_length:
+        return json_response({'success': False, 'error': 'Incomplete chunk',
+                              'received': upload['received']}), 400
+    
+    received = end + 1
+    if received < total_size:
+        with video_db() as conn:
+            conn.execute("UPDATE uploads SET received = ? WHERE id = ?", (received, upload_id))
+        return json_response({'success': True, 'upload_id': upload_id, 'received': received})
+    
+    # Last chunk, so move the file into place and register the video
+    try:
+        video_entry = finalize_chunked_upload(upload)
+    except Exception as e:
+        print(f"Cannot finalize upload {upload_id}: {e}")
+        # The upload has been discarded, so resending chunks cannot help
+        return json_response({'success': False, 'error': 'Could not save the uploaded video',
+                              'retry': False}), 500
+    
+    return json_response({'success': True, 'status': 'complete', 'video_id': video_entry['id'],
+                          'redirect': url_for('review_processing')})
+
 @app.route('/review-processing')
 def review_processing():
     """Show review processing status"""
-    processing_info = session.get('processing_video')
+    processing_info = get_processing_video()
     if not processing_info:
         flash('No review processing in progress', 'warning')
         return redirect(url_for('dashboard'))
@@ -263,31 +668,57 @@ def review_processing():
 def process_review_api():
     """API endpoint to process review with context isolation"""
     try:
-        data = request.get_json()
+        data = request.get_json(silent=True) or {}
         filepath = data.get('filepath')
         game_info = data.get('game_info', {})
         
+        # Default to the video uploaded in this session
+        if not filepath:
+            processing_info = get_processing_video() or {}
+            if processing_info.get('job_id'):
+                # Already queued when the upload finished
+                return json_response({'status': 'queued', 'job_id': processing_info['job_id']})
+            filepath = processing_info.get('filepath')
+            game_info = game_info or processing_info.get('game_info', {})
+        
         if not filepath or not os.path.exists(filepath):
-            return jsonify({'error': 'Invalid file path', 'status': 'error'})
-        
-        # Mock processing for production demo
-        combined_result = {
-            'status': 'complete',
-            'context_analysis': {'status': 'demo_mode', 'message': 'AI analysis in demo mode'},
-            'agent_consensus': {'status': 'demo_mode'},
-            'quality_assessment': {'status': 'demo_mode'},
-            'processing_timestamp': datetime.now().isoformat(),
-            'game_info': game_info,
-            'filepath': filepath
-        }
+            return json_response({'error': 'Invalid file path', 'status': 'error'})
         
-        # Store results
-        store_analysis_results(combined_result)
+        # Hand off to a background worker when the queue is available
+        if review_queue is not None:
+            return json_response({'status': 'queued', 'job_id': enqueue_review(filepath, game_info)})
         
-        return jsonify(combined_result)
+        analyses = run_async(
+            analyze_review_video(filepath, game_info),
+            timeout=CONFIG['PROCESSING_TIMEOUT']
+        )
+        
+        return json_response(combine_review_results(filepath, game_info, *analyses))
             
     except Exception as e:
-        return jsonify({'error': str(e), 'status': 'error'})
+        return json_response({'error': str(e), 'status': 'error'})
+
+@app.route('/api/job-status/<job_id>')
+def job_status(job_id):
+    """Get status of a queued review processing job"""
+    if review_queue is None:
+        return json_response({'error': 'Background processing not enabled', 'status': 'error'})
+    
+    from rq.job import Job
+    from rq.exceptions import NoSuchJobError
+    
+    try:
+        job = Job.fetch(job_id, connection=redis_client)
+    except NoSuchJobError:
+        return json_response({'error': 'Job not found', 'status': 'error'})
+    
+    status = job.get_status()
+    return json_response({
+        'job_id': job.id,
+        'status': status,
+        'result': job.result if status == 'finished' else None,
+        'error': 'Review processing failed' if status == 'failed' else None
+    })
 
 @app.route('/review-editor')
 def review_editor():
@@ -340,28 +771,26 @@ def optimize_for_platform():
         platform = data.get('platform')
         review_content = data.get('review_content')
         
-        # Platform-specific optimization
-        optimized_content = {
-            'youtube': optimize_for_youtube(review_content),
-            'tiktok': optimize_for_tiktok(review_content),
-            'instagram': optimize_for_instagram(review_content),
-            'reddit': optimize_for_reddit(review_content)
-        }.get(platform, review_content)
+        # Platform-specific optimization (only for the requested platform)
+        optimizer = PLATFORM_OPTIMIZERS.get(platform)
+        optimized_content = optimizer(review_content) if optimizer else review_content
         
-        return jsonify({'optimized_content': optimized_content})
+        return json_response({'optimized_content': optimized_content})
         
     except Exception as e:
-        return jsonify({'error': str(e)})
+        return json_response({'error': str(e)})
 
 @app.route('/game-database')
 def game_database():
     """VR game database and research tools"""
     try:
         # Get database statistics
-        db_stats = game_compressor.get_database_stats()
+        db_stats = get_cached_json('game:db_stats', CONFIG['GAME_DATABASE_CACHE_TTL'],
+                                   game_compressor.get_database_stats)
         
         # Get trending/high priority games
-        trending_games = game_compressor.search_games_by_criteria(min_rating=4.0)
+        trending_games = get_cached_json('game:trending', CONFIG['GAME_DATABASE_CACHE_TTL'],
+                                         lambda: game_compressor.search_games_by_criteria(min_rating=4.0))
         
         return render_template('game_database.html',
                              db_stats=db_stats,
@@ -377,9 +806,9 @@ def get_notifications_api():
     """Get current notifications for the interface"""
     try:
         notifications = get_notifications()
-        return jsonify({'notifications': notifications})
+        return json_response({'notifications': notifications})
     except Exception as e:
-        return jsonify({'error': str(e), 'notifications': []})
+        return json_response({'error': str(e), 'notifications': []})
 
 @app.route('/parent-dashboard')
 def parent_dashboard():
@@ -406,7 +835,7 @@ def video_library():
     """Display all uploaded videos"""
     try:
         videos = load_video_database()
-        total_size = calculate_total_video_size(videos)
+        total_size = calculate_total_video_size()
         
         return render_template('video_library.html',
                              videos=videos,
@@ -422,8 +851,7 @@ def video_library():
 @app.route('/video/<video_id>')
 def video_details(video_id):
     """Show detailed information about a specific video"""
-    videos = load_video_database()
-    video = next((v for v in videos if v['id'] == video_id), None)
+    video = get_video(video_id)
     
     if not video:
         flash('Video not found', 'error')
@@ -431,33 +859,70 @@ def video_details(video_id):
     
     return render_template('video_details.html', video=video)
 
+@app.route('/download/<video_id>')
+def download_video(video_id):
+    """Download an uploaded video without copying its bytes through Python"""
+    video = get_video(video_id)
+    
+    if not video or not os.path.isfile(video['filepath']):
+        flash('Video not found', 'error')
+        return redirect(url_for('video_library'))
+    
+    prefix = CONFIG['X_ACCEL_REDIRECT_PREFIX']
+    if prefix:
+        # nginx serves the file itself with sendfile(2)
+        response = app.response_class(mimetype=mimetypes.guess_type(video['filename'])[0] or 'application/octet-stream')
+        response.headers['X-Accel-Redirect'] = prefix.rstrip('/') + '/' + quote(video['filename'])
+        response.headers['Content-Disposition'] = f"attachment; filename*=UTF-8''{quote(video['filename'])}"
+        return response
+    
+    # Without a proxy, gunicorn sends the file wrapper with sendfile(2)
+    return send_file(video['filepath'], as_attachment=True,
+                     download_name=video['filename'], conditional=True)
+
+@app.route('/video-file/<video_id>')
+def stream_video(video_id):
+    """Stream an uploaded video inline with conditional and byte-range requests"""
+    video = get_video(video_id)
+    if not video:
+        return json_response({'error': 'Video not found'}), 404
+    
+    # ETag/Last-Modified let repeat views end in a 304, and Range requests
+    # let the player seek without downloading the whole file
+    response = send_from_directory(CONFIG['UPLOAD_FOLDER'], video['filename'],
+                                   conditional=True, max_age=CONFIG['VIDEO_STREAM_MAX_AGE'])
+    # Reviewers' own videos may sit in the browser cache, but not in shared proxies
+    response.cache_control.public = False
+    response.cache_control.private = True
+    return response
+
 @app.route('/api/delete-video/<video_id>', methods=['DELETE'])
 def delete_video(video_id):
     """Delete a video and remove from database"""
     try:
-        videos = load_video_database()
-        video = next((v for v in videos if v['id'] == video_id), None)
+        video = get_video(video_id)
         
         if not video:
-            return jsonify({'success': False, 'error': 'Video not found'})
+            return json_response({'success': False, 'error': 'Video not found'})
         
-        # Delete the file
-        if os.path.exists(video['filepath']):
-            os.remove(video['filepath'])
+        # Delete the file; a file that is already gone is not an error
+        if video['filepath']:
+            try:
+                os.remove(video['filepath'])
+            except FileNotFoundError:
+                pass
         
         # Remove from database
-        videos = [v for v in videos if v['id'] != video_id]
-        save_video_database(videos)
+        delete_video_from_database(video_id)
         
-        return jsonify({'success': True})
+        return json_response({'success': True})
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)})
+        return json_response({'success': False, 'error': str(e)})
 
 @app.route('/video-editor/<video_id>')
 def video_editor(video_id):
     """AI-powered video editing interface"""
-    videos = load_video_database()
-    video = next((v for v in videos if v['id'] == video_id), None)
+    video = get_video(video_id)
     
     if not video:
         flash('Video not found', 'error')
@@ -474,11 +939,10 @@ def process_video_workflow():
         workflow = data.get('workflow')
         
         # Get video from database
-        videos = load_video_database()
-        video = next((v for v in videos if v['id'] == video_id), None)
+        video = get_video(video_id)
         
         if not video:
-            return jsonify({'success': False, 'error': 'Video not found'})
+            return json_response({'success': False, 'error': 'Video not found'})
         
         # Import video processing engine
         try:
@@ -489,18 +953,13 @@ def process_video_workflow():
             output_dir = os.path.join(CONFIG['PROJECT_ROOT'], 'video_outputs')
             os.makedirs(output_dir, exist_ok=True)
             
-            # Start workflow (in production, this would be async)
-            import asyncio
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            workflow_state = loop.run_until_complete(
+            # The workflow runs ffmpeg/OpenCV synchronously, so it gets its own loop
+            # in this request thread instead of blocking the shared analysis loop
+            workflow_state = asyncio.run(
                 engine.process_gameplay_video(video['filepath'], workflow, output_dir)
             )
             
-            loop.close()
-            
-            return jsonify({
+            return json_response({
                 'success': True,
                 'workflow_id': workflow_state['id'],
                 'status': workflow_state['status']
@@ -508,7 +967,7 @@ def process_video_workflow():
             
         except ImportError:
             # Fallback for demo without video processing libraries
-            return jsonify({
+            return json_response({
                 'success': True,
                 'workflow_id': 'demo_' + datetime.now().strftime('%Y%m%d_%H%M%S'),
                 'status': 'demo_mode',
@@ -516,7 +975,7 @@ def process_video_workflow():
             })
         
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)})
+        return json_response({'success': False, 'error': str(e)})
 
 @app.route('/api/workflow-status/<workflow_id>')
 def workflow_status(workflow_id):
@@ -528,7 +987,7 @@ def workflow_status(workflow_id):
             steps = ['analyze', 'extract_highlights', 'create_edits', 'optimize', 'finalize']
             completed = random.randint(1, len(steps))
             
-            return jsonify({
+            return json_response({
                 'workflow_id': workflow_id,
                 'status': 'completed' if completed == len(steps) else 'processing',
                 'steps_completed': steps[:completed],
@@ -552,10 +1011,10 @@ def workflow_status(workflow_id):
         output_dir = os.path.join(CONFIG['PROJECT_ROOT'], 'video_outputs')
         
         state = engine.get_workflow_status(workflow_id, output_dir)
-        return jsonify(state or {'error': 'Workflow not found'})
+        return json_response(state or {'error': 'Workflow not found'})
         
     except Exception as e:
-        return jsonify({'error': str(e)})
+        return json_response({'error': str(e)})
 
 # Helper functions
 def get_data_path(relative_path):
@@ -574,75 +1033,193 @@ def get_data_path(relative_path):
     else:
         # In development, use project structure
         return os.path.join(CONFIG['PROJECT_ROOT'], relative_path)
+
+# Data locations, resolved once at startup
+CONFIG['VIDEO_DATABASE'] = get_data_path('videos.db')
+RESULTS_DIR = get_data_path('learning_memory/analysis_results')
+NOTIFICATIONS_DIR = get_data_path('web_interface/notifications')
+RECENT_REVIEWS_INDEX = get_data_path('learning_memory/recent_reviews.ndjson')
+QUALITY_EVOLUTION_FILE = get_data_path('learning_memory/review_quality_evolution.json')
+REVIEW_PATTERNS_FILE = get_data_path('learning_memory/successful_review_patterns.json')
+
+try:
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+except (PermissionError, OSError) as e:
+    print(f"Cannot create results directory: {RESULTS_DIR} - {e}")
+
+def write_file_atomic(path, data):
+    """Write bytes to a file so readers never see a partially written file"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=f".{os.path.basename(path)}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            # Make the data durable before the rename publishes it, so a crash
+            # can't leave an empty file under the final name
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def file_mtime_ns(path):
+    """Get a file's modification time in nanoseconds, or None if it is missing"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+def tail_lines(f, count):
+    """Get the last lines of a binary file, paging in only the end of it"""
+    size = os.fstat(f.fileno()).st_size
+    if size == 0:
+        # mmap cannot map an empty file
+        return []
+    
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        end = size - 1 if mm[size - 1] == ord('\n') else size
+        pos = end
+        for _ in range(count):
+            pos = mm.rfind(b'\n', 0, pos)
+            if pos < 0:
+                break
+        return mm[pos + 1:end].splitlines()
+
 def get_recent_reviews():
     """Get recent review data"""
     try:
-        results_dir = get_data_path('learning_memory/analysis_results')
-        if not os.path.exists(results_dir):
-            return []
-        
-        review_files = sorted(
-            [f for f in os.listdir(results_dir) if f.endswith('.json')],
-            reverse=True
-        )[:5]
-        
-        reviews = []
-        for filename in review_files:
-            filepath = os.path.join(results_dir, filename)
-            with open(filepath, 'r') as f:
-                review_data = json.load(f)
-                reviews.append({
-                    'id': filename.replace('.json', ''),
-                    'game_name': review_data.get('game_name', 'Unknown'),
-                    'timestamp': review_data.get('timestamp', ''),
-                    'overall_score': review_data.get('overall_score', 0),
-                    'educational_value': review_data.get('educational_value', 0)
-                })
+        try:
+            with open(RECENT_REVIEWS_INDEX, 'rb') as f:
+                lines = tail_lines(f, 5)
+        except FileNotFoundError:
+            # No index yet (results stored before it existed), scan the results
+            return scan_recent_reviews()
         
-        return reviews
+        return [loads_json(line) for line in reversed(lines) if line.strip()]
     except Exception as e:
         print(f"Error getting recent reviews: {e}")
         return []
 
+_read_executor = None
+_read_executor_lock = threading.Lock()
+
+def get_read_executor():
+    """Get the shared thread pool used for batched file reads"""
+    global _read_executor
+    with _read_executor_lock:
+        if _read_executor is None:
+            _read_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=8, thread_name_prefix='json-read'
+            )
+        return _read_executor
+
+def read_json_files(paths):
+    """Read and parse a batch of JSON files, keeping the order of paths
+
+    The reads are issued together on a shared thread pool so their I/O
+    latency overlaps instead of being paid once per file.
+    """
+    if len(paths) <= 1:
+        return [load_json_file(path) for path in paths]
+    return list(get_read_executor().map(load_json_file, paths))
+
+def scan_recent_reviews():
+    """Get recent review data by reading the analysis results directory"""
+    try:
+        filenames = os.listdir(RESULTS_DIR)
+    except FileNotFoundError:
+        return []
+    
+    review_files = heapq.nlargest(5, (f for f in filenames if f.endswith('.json')))
+    
+    review_data = read_json_files([os.path.join(RESULTS_DIR, f) for f in review_files])
+    return [summarize_review(filename.replace('.json', ''), data)
+            for filename, data in zip(review_files, review_data)]
+
+def summarize_review(review_id, review_data):
+    """Get the dashboard summary of a stored review"""
+    return {
+        'id': review_id,
+        'game_name': review_data.get('game_name', 'Unknown'),
+        'timestamp': review_data.get('timestamp', ''),
+        'overall_score': review_data.get('overall_score', 0),
+        'educational_value': review_data.get('educational_value', 0)
+    }
+
+_recent_reviews_lock = threading.Lock()
+
+@contextlib.contextmanager
+def recent_reviews_lock():
+    """Serialize index writers across threads and worker processes"""
+    # Compaction replaces the index file, so the lock lives in a separate file
+    with _recent_reviews_lock:
+        if fcntl is None:
+            yield
+            return
+        with open(RECENT_REVIEWS_INDEX + '.lock', 'ab') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+def append_recent_review(summary):
+    """Append a review summary to the bounded recent reviews index"""
+    index_file = RECENT_REVIEWS_INDEX
+    line = dumps_json(summary) + b'\n'
+    with recent_reviews_lock():
+        try:
+            with open(index_file, 'rb') as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            # First entry: seed with the results stored before the index existed
+            # (the scan already sees this review's own result file)
+            earlier = [review for review in scan_recent_reviews() if review['id'] != summary['id']]
+            write_file_atomic(index_file, b''.join(dumps_json(review) + b'\n' for review in reversed(earlier)) + line)
+            return
+        
+        # Compact once the index grows past its limit
+        if len(lines) >= CONFIG['RECENT_REVIEWS_INDEX_MAX']:
+            write_file_atomic(index_file, b''.join((lines + [line])[-CONFIG['RECENT_REVIEWS_INDEX_KEEP']:]))
+        else:
+            with open(index_file, 'ab') as f:
+                f.write(line)
+
 def get_notifications():
     """Get current notifications"""
-    notifications = []
-    
     try:
-        notification_dir = get_data_path('web_interface/notifications')
-        
-        if os.path.exists(notification_dir):
-            for filename in os.listdir(notification_dir):
-                if filename.endswith('.json'):
-                    filepath = os.path.join(notification_dir, filename)
-                    with open(filepath, 'r') as f:
-                        notification = json.load(f)
-                        notifications.append(notification)
+        # Stat the files (no reads) to find out whether anything changed
+        with os.scandir(NOTIFICATIONS_DIR) as entries:
+            versions = tuple(sorted(
+                (entry.name, entry.stat().st_mtime_ns)
+                for entry in entries
+                if entry.name.endswith('.json') and entry.is_file()
+            ))
+        return list(_notifications_cached(NOTIFICATIONS_DIR, versions))
+    except FileNotFoundError:
+        pass
     except Exception as e:
         print(f"Error getting notifications: {e}")
     
-    return sorted(notifications, key=lambda x: x.get('timestamp', ''), reverse=True)[:5]
+    return []
+
+@functools.lru_cache(maxsize=4)
+def _notifications_cached(notifications_dir, versions):
+    """Load the newest notifications once per set of notification file versions"""
+    notifications = read_json_files([os.path.join(notifications_dir, name) for name, _ in versions])
+    return tuple(heapq.nlargest(5, notifications, key=lambda x: x.get('timestamp', '')))
 
 def get_review_statistics():
     """Get review statistics for dashboard"""
     try:
-        memory_file = get_data_path('learning_memory/review_quality_evolution.json')
-        
-        if os.path.exists(memory_file):
-            with open(memory_file, 'r') as f:
-                reviews = json.load(f)
-            
-            if reviews:
-                total_reviews = len(reviews)
-                avg_score = sum(r.get('overall_score', 0) for r in reviews) / total_reviews
-                avg_educational = sum(r.get('educational_value', 0) for r in reviews) / total_reviews
-                
-                return {
-                    'total_reviews': total_reviews,
-                    'average_score': round(avg_score, 1),
-                    'average_educational': round(avg_educational, 1),
-                    'recent_trend': 'improving' if len(reviews) >= 2 and reviews[-1].get('overall_score', 0) > reviews[-2].get('overall_score', 0) else 'stable'
-                }
+        mtime_ns = file_mtime_ns(QUALITY_EVOLUTION_FILE)
+        if mtime_ns is not None:
+            stats = _review_statistics_cached(QUALITY_EVOLUTION_FILE, mtime_ns)
+            if stats:
+                return stats
     except Exception as e:
         print(f"Error getting review statistics: {e}")
     
@@ -653,22 +1230,352 @@ def get_review_statistics():
         'recent_trend': 'stable'
     }
 
+@functools.lru_cache(maxsize=4)
+def _review_history_cached(memory_file, mtime_ns):
+    """Parse the quality history and build its score columns once per file version"""
+    reviews = load_json_file(memory_file)
+    return reviews, review_scores(reviews), review_scores(reviews, 'educational_value')
+
+@functools.lru_cache(maxsize=4)
+def _review_statistics_cached(memory_file, mtime_ns):
+    """Compute dashboard statistics once per version of the quality history file"""
+    reviews, scores, educational = _review_history_cached(memory_file, mtime_ns)
+    
+    if not reviews:
+        return None
+    
+    return {
+        'total_reviews': len(reviews),
+        'average_score': round(float(scores.mean()), 1),
+        'average_educational': round(float(educational.mean()), 1),
+        'recent_trend': 'improving' if len(scores) >= 2 and scores[-1] > scores[-2] else 'stable'
+    }
+
+def new_video_entry(original_filename, form):
+    """Create the database entry for an uploaded video from its form fields"""
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    game_safe = secure_filename(form.get('game_name', 'Unknown'))
+    # The random suffix keeps two uploads of a game in the same second apart
+    video_id = f"{timestamp}_{game_safe}_{secrets.token_hex(4)}"
+    filename = f"{video_id}_{secure_filename(original_filename)}"
+    game_name = form.get('game_name', 'Unknown Game')
+    review_type = form.get('review_type', 'full-review')
+    
+    return {
+        'id': video_id,
+        'filename': filename,
+        'filepath': os.path.join(CONFIG['UPLOAD_FOLDER'], filename),
+        'game_name': game_name,
+        'review_type': review_type.replace('-', ' ').title(),
+        'upload_date': datetime.now().isoformat(),
+        'size': None,
+        'status': 'Processing',
+        'game_info': {
+            'name': game_name,
+            'genre': form.get('game_genre', 'Unknown'),
+            'platform': form.get('game_platform', 'VR'),
+            'price': float(form.get('game_price', 0)),
+            'rating': float(form.get('game_rating', 0))
+        }
+    }
+
+def register_uploaded_video(video_entry):
+    """Record a video whose file is in place and queue it for processing"""
+    video_entry['size'] = format_file_size(os.path.getsize(video_entry['filepath']))
+    save_video_to_database(video_entry)
+    
+    # Start analysis on a worker so the upload request can return right away
+    job_id = None
+    if review_queue is not None:
+        try:
+            job_id = enqueue_review(video_entry['filepath'], video_entry['game_info'])
+        except Exception as e:
+            print(f"Cannot queue review processing: {e}")
+    save_processing_video(video_entry['id'], job_id)
+
+_upload_buffers = threading.local()
+
+def get_upload_buffer():
+    """Get this thread's reusable upload copy buffer"""
+    buffer = getattr(_upload_buffers, 'buffer', None)
+    if buffer is None:
+        buffer = _upload_buffers.buffer = memoryview(bytearray(CONFIG['UPLOAD_COPY_BUFFER_SIZE']))
+    return buffer
+
+def read_into(stream, view):
+    """Read from a request stream into a buffer, returning the byte count"""
+    readinto = getattr(stream, 'readinto', None)
+    if readinto is not None:
+        return readinto(view) or 0
+    
+    data = stream.read(len(view))
+    view[:len(data)] = data
+    return len(data)
+
+def advise_dont_cache(fd, offset=0, length=0):
+    """Tell the kernel a written range will not be read back soon
+
+    Uploaded videos are written once and read later by the analysis
+    pipeline, so keeping them in the page cache only evicts hotter data.
+    On Linux this also starts writeback of the range.
+    """
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(fd, offset, length, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass
+
+def drop_page_cache(path):
+    """Advise the kernel not to keep a whole uploaded file cached"""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        advise_dont_cache(fd)
+    finally:
+        os.close(fd)
+
+UPLOAD_TEXT_FIELDS = ('filename', 'game_name', 'review_type', 'game_genre', 'game_platform')
+UPLOAD_NUMBER_FIELDS = ('game_price', 'game_rating')
+
+def normalize_upload_metadata(form):
+    """Validate the fields sent when a resumable upload starts
+
+    Raises ValueError with a message for the client when a field is malformed.
+    """
+    if not isinstance(form, dict):
+        raise ValueError('Upload metadata must be an object')
+    
+    metadata = {}
+    for field in UPLOAD_TEXT_FIELDS:
+        value = form.get(field)
+        if value is None:
+            continue
+        if not isinstance(value, str):
+            raise ValueError(f'{field} must be a string')
+        metadata[field] = value
+    
+    for field in UPLOAD_NUMBER_FIELDS:
+        value = form.get(field)
+        if value is None or value == '':
+            continue
+        try:
+            if isinstance(value, bool):
+                raise ValueError
+            number = float(value)
+        except (TypeError, ValueError):
+            raise ValueError(f'{field} must be a number')
+        if not math.isfinite(number):
+            raise ValueError(f'{field} must be a number')
+        metadata[field] = number
+    
+    return metadata
+
+def finalize_chunked_upload(upload):
+    """Move a completed resumable upload into place and register its video
+
+    The upload is discarded either way; on failure its files are removed too.
+    """
+    metadata = loads_json(upload['metadata_json'])
+    video_entry = new_video_entry(metadata.get('filename', ''), metadata)
+    try:
+        os.truncate(upload['part_path'], upload['total_size'])
+        os.replace(upload['part_path'], video_entry['filepath'])
+        register_uploaded_video(video_entry)
+    except Exception:
+        for path in (upload['part_path'], video_entry['filepath']):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        raise
+    finally:
+        with video_db() as conn:
+            conn.execute("DELETE FROM uploads WHERE id = ?", (upload['id'],))
+    return video_entry
+
+def expire_stale_uploads():
+    """Discard resumable uploads that have not received a chunk within UPLOAD_STALE_AFTER"""
+    # Every chunk write touches the part file, so its mtime is the last activity
+    cutoff = time.time() - CONFIG['UPLOAD_STALE_AFTER']
+    with video_db() as conn:
+        for upload_id, part_path in conn.execute("SELECT id, part_path FROM uploads").fetchall():
+            try:
+                stale = os.stat(part_path).st_mtime < cutoff
+            except OSError:
+                stale = True
+            if stale:
+                conn.execute("DELETE FROM uploads WHERE id = ?", (upload_id,))
+    
+    # Also catches part files whose row is gone and spool files left by a crash
+    with os.scandir(CONFIG['UPLOAD_FOLDER']) as entries:
+        for entry in entries:
+            if entry.name.startswith('.upload-') and entry.name.endswith('.part'):
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.remove(entry.path)
+                except OSError:
+                    pass
+
+def get_chunked_upload(upload_id):
+    """Look up an in-progress resumable upload"""
+    with video_db() as conn:
+        row = conn.execute("SELECT * FROM uploads WHERE id = ?", (upload_id,)).fetchone()
+    return dict(row) if row else None
+
+def parse_content_range(header):
+    """Parse a 'bytes start-end/total' Content-Range header"""
+    try:
+        unit, _, byte_range = header.partition(' ')
+        span, _, total = byte_range.partition('/')
+        start, _, end = span.partition('-')
+        start, end, total = int(start), int(end), int(total)
+    except ValueError:
+        return None
+    
+    if unit != 'bytes' or not 0 <= start <= end < total:
+        return None
+    return start, end, total
+
+def save_processing_video(video_id, job_id=None):
+    """Remember the video being processed for this session (IDs only, the entry stays in the database)"""
+    session['processing_video_id'] = video_id
+    if job_id:
+        session['processing_job_id'] = job_id
+    else:
+        session.pop('processing_job_id', None)
+
+def get_processing_video():
+    """Get the video being processed for the current session"""
+    video_id = session.get('processing_video_id')
+    if not video_id:
+        return None
+    
+    video = get_video(video_id)
+    if video is not None and session.get('processing_job_id'):
+        video['job_id'] = session['processing_job_id']
+    return video
+
+def game_info_cache_key(game_name):
+    """Get the cache key for a game's info response"""
+    return f"game:info:{game_name.lower()}"
+
+def cache_get(key):
+    """Read a cache entry, treating an unavailable cache as a miss"""
+    try:
+        return cache_client.get(key)
+    except CACHE_ERRORS as e:
+        print(f"Cache read failed for {key}: {e}")
+        return None
+
+def cache_setex(key, ttl, value):
+    """Write a cache entry, skipping it when the cache is unavailable"""
+    try:
+        cache_client.setex(key, ttl, value)
+    except CACHE_ERRORS as e:
+        print(f"Cache write failed for {key}: {e}")
+
+def get_cached_json(key, ttl, compute):
+    """Cache-aside lookup of a JSON-serializable value"""
+    cached = cache_get(key)
+    if cached is not None:
+        return loads_json(cached)
+    
+    value = compute()
+    cache_setex(key, ttl, dumps_json(value))
+    return value
+
+def trigrams(text):
+    """Get the set of 3-character substrings of a string"""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+class GameSearchIndex:
+    """Lowercase trigram index over game names and genres"""
+    
+    def __init__(self, games):
+        self.games = list(games)
+        self._fields = []
+        self._trigram_counts = []
+        self._postings = {}
+        
+        for idx, game in enumerate(self.games):
+            name = game.get('name', '').lower()
+            genre = game.get('genre', '').lower()
+            self._fields.append((name, genre))
+            game_trigrams = trigrams(name) | trigrams(genre)
+            self._trigram_counts.append(len(game_trigrams))
+            for trigram in game_trigrams:
+                self._postings.setdefault(trigram, set()).add(idx)
+    
+    def search(self, query):
+        """Find games whose name or genre contains the query"""
+        query = query.lower()
+        query_trigrams = trigrams(query)
+        
+        if query_trigrams:
+            postings = [self._postings.get(trigram, set()) for trigram in query_trigrams]
+            candidates = sorted(set.intersection(*postings))
+        else:
+            # Queries shorter than a trigram fall back to a scan
+            candidates = range(len(self.games))
+        
+        # Confirm candidates, since matching trigrams may come from both fields
+        return [
+            self.games[idx] for idx in candidates
+            if query in self._fields[idx][0] or query in self._fields[idx][1]
+        ]
+    
+    def similar(self, query, limit=10, min_score=0.5):
+        """Rank games by trigram similarity to the query, for misspelled or partial names"""
+        query_trigrams = trigrams(query.lower())
+        if not query_trigrams:
+            return []
+        
+        shared = {}
+        for trigram in query_trigrams:
+            for idx in self._postings.get(trigram, ()):
+                shared[idx] = shared.get(idx, 0) + 1
+        
+        # Rank by the share of query trigrams found, then by Dice coefficient
+        # so shorter, closer names win ties
+        scored = [
+            (count / len(query_trigrams), 2 * count / (len(query_trigrams) + self._trigram_counts[idx]), -idx)
+            for idx, count in shared.items()
+            if count >= min_score * len(query_trigrams)
+        ]
+        return [self.games[-item[2]] for item in heapq.nlargest(limit, scored)]
+
+_game_index = None
+_game_index_built_at = 0.0
+_game_index_lock = threading.Lock()
+
+def get_game_index():
+    """Get the game search index, rebuilding it when it has expired"""
+    global _game_index, _game_index_built_at
+    with _game_index_lock:
+        if _game_index is None or time.monotonic() - _game_index_built_at > CONFIG['GAME_INDEX_TTL']:
+            _game_index = GameSearchIndex(game_compressor.search_games_by_criteria())
+            _game_index_built_at = time.monotonic()
+    return _game_index
+
+MOCK_VR_GAMES = (
+    {'name': 'Half-Life: Alyx', 'genre': 'Action/Adventure', 'platform': 'PC VR', 'price': 59.99, 'rating': 4.8, 'review_priority': 9},
+    {'name': 'Beat Saber', 'genre': 'Rhythm', 'platform': 'Multi-Platform VR', 'price': 29.99, 'rating': 4.7, 'review_priority': 8},
+    {'name': 'Boneworks', 'genre': 'Action/Physics', 'platform': 'PC VR', 'price': 29.99, 'rating': 4.2, 'review_priority': 7},
+    {'name': 'The Walking Dead: Saints & Sinners', 'genre': 'Survival Horror', 'platform': 'Multi-Platform VR', 'price': 39.99, 'rating': 4.5, 'review_priority': 8},
+    {'name': 'Superhot VR', 'genre': 'Action', 'platform': 'Multi-Platform VR', 'price': 24.99, 'rating': 4.6, 'review_priority': 7},
+    {'name': 'Job Simulator', 'genre': 'Simulation/Comedy', 'platform': 'Multi-Platform VR', 'price': 19.99, 'rating': 4.3, 'review_priority': 6},
+    {'name': 'Pistol Whip', 'genre': 'Rhythm/Shooter', 'platform': 'Multi-Platform VR', 'price': 24.99, 'rating': 4.4, 'review_priority': 7},
+    {'name': 'Vacation Simulator', 'genre': 'Simulation/Comedy', 'platform': 'Multi-Platform VR', 'price': 29.99, 'rating': 4.2, 'review_priority': 6}
+)
+
+MOCK_GAME_INDEX = GameSearchIndex(MOCK_VR_GAMES)
+
 def get_mock_vr_games(query):
     """Get mock VR games for demonstration"""
-    mock_games = [
-        {'name': 'Half-Life: Alyx', 'genre': 'Action/Adventure', 'platform': 'PC VR', 'price': 59.99, 'rating': 4.8, 'review_priority': 9},
-        {'name': 'Beat Saber', 'genre': 'Rhythm', 'platform': 'Multi-Platform VR', 'price': 29.99, 'rating': 4.7, 'review_priority': 8},
-        {'name': 'Boneworks', 'genre': 'Action/Physics', 'platform': 'PC VR', 'price': 29.99, 'rating': 4.2, 'review_priority': 7},
-        {'name': 'The Walking Dead: Saints & Sinners', 'genre': 'Survival Horror', 'platform': 'Multi-Platform VR', 'price': 39.99, 'rating': 4.5, 'review_priority': 8},
-        {'name': 'Superhot VR', 'genre': 'Action', 'platform': 'Multi-Platform VR', 'price': 24.99, 'rating': 4.6, 'review_priority': 7},
-        {'name': 'Job Simulator', 'genre': 'Simulation/Comedy', 'platform': 'Multi-Platform VR', 'price': 19.99, 'rating': 4.3, 'review_priority': 6},
-        {'name': 'Pistol Whip', 'genre': 'Rhythm/Shooter', 'platform': 'Multi-Platform VR', 'price': 24.99, 'rating': 4.4, 'review_priority': 7},
-        {'name': 'Vacation Simulator', 'genre': 'Simulation/Comedy', 'platform': 'Multi-Platform VR', 'price': 29.99, 'rating': 4.2, 'review_priority': 6}
-    ]
-    
-    # Filter by query
-    filtered = [game for game in mock_games if query.lower() in game['name'].lower() or query.lower() in game['genre'].lower()]
-    return filtered if filtered else mock_games[:3]
+    filtered = MOCK_GAME_INDEX.search(query) or MOCK_GAME_INDEX.similar(query)
+    return filtered if filtered else list(MOCK_VR_GAMES[:3])
 
 def create_mock_game_info(game_name):
     """Create mock game info for demonstration"""
@@ -690,23 +1597,19 @@ def create_mock_game_info(game_name):
 def store_analysis_results(analysis_result):
     """Store analysis results for future reference"""
     try:
-        results_dir = get_data_path('learning_memory/analysis_results')
-        try:
-            os.makedirs(results_dir, exist_ok=True)
-        except (PermissionError, OSError):
-            print(f"Cannot create results directory: {results_dir}")
-            return None
-        
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         game_name = analysis_result['game_info'].get('name', 'Unknown').replace(' ', '_')
         filename = f"{game_name}_{timestamp}.json"
         
-        filepath = os.path.join(results_dir, filename)
-        with open(filepath, 'w') as f:
-            json.dump(analysis_result, f, indent=2, default=str)
+        filepath = os.path.join(RESULTS_DIR, filename)
+        # Stored compact; /admin/export-pretty/<id> indents a result on demand
+        write_file_atomic(filepath, dumps_json(analysis_result))
+        
+        analysis_id = filename.replace('.json', '')
+        append_recent_review(summarize_review(analysis_id, analysis_result))
         
         print(f"Analysis results stored: {filename}")
-        return filename.replace('.json', '')
+        return analysis_id
         
     except Exception as e:
         print(f"Error storing analysis results: {e}")
@@ -715,12 +1618,10 @@ def store_analysis_results(analysis_result):
 def load_analysis_results(analysis_id):
     """Load analysis results by ID"""
     try:
-        results_dir = get_data_path('learning_memory/analysis_results')
-        filepath = os.path.join(results_dir, f"{analysis_id}.json")
-        
-        if os.path.exists(filepath):
-            with open(filepath, 'r') as f:
-                return json.load(f)
+        filepath = os.path.join(RESULTS_DIR, f"{analysis_id}.json")
+        return load_json_file(filepath)
+    except FileNotFoundError:
+        pass
     except Exception as e:
         print(f"Error loading analysis results: {e}")
     
@@ -733,46 +1634,52 @@ def load_review_data(review_id):
 def get_review_analytics():
     """Get review performance analytics"""
     try:
-        memory_file = get_data_path('learning_memory/review_quality_evolution.json')
-        
-        if os.path.exists(memory_file):
-            with open(memory_file, 'r') as f:
-                reviews = json.load(f)
-            
-            # Calculate analytics
-            analytics = {
-                'total_reviews': len(reviews),
-                'quality_trend': calculate_quality_trend(reviews),
-                'genre_performance': calculate_genre_performance(reviews),
-                'improvement_areas': identify_improvement_areas(reviews)
-            }
-            
-            return analytics
+        mtime_ns = file_mtime_ns(QUALITY_EVOLUTION_FILE)
+        if mtime_ns is not None:
+            return _review_analytics_cached(QUALITY_EVOLUTION_FILE, mtime_ns)
     except Exception as e:
         print(f"Error getting review analytics: {e}")
     
     return {}
 
+@functools.lru_cache(maxsize=4)
+def _review_analytics_cached(memory_file, mtime_ns):
+    """Compute analytics once per version of the quality history file"""
+    # The dashboard statistics share the same parsed history and score columns
+    reviews, scores, _ = _review_history_cached(memory_file, mtime_ns)
+    
+    # Calculate analytics
+    return {
+        'total_reviews': len(reviews),
+        'quality_trend': calculate_quality_trend(reviews, scores),
+        'genre_performance': calculate_genre_performance(reviews, scores),
+        'improvement_areas': identify_improvement_areas(reviews)
+    }
+
 def get_learning_insights():
     """Get learning insights from review history"""
     try:
-        patterns_file = get_data_path('learning_memory/successful_review_patterns.json')
-        
-        if os.path.exists(patterns_file):
-            with open(patterns_file, 'r') as f:
-                return json.load(f)
+        mtime_ns = file_mtime_ns(REVIEW_PATTERNS_FILE)
+        if mtime_ns is not None:
+            return _learning_insights_cached(REVIEW_PATTERNS_FILE, mtime_ns)
     except Exception as e:
         print(f"Error getting learning insights: {e}")
     
     return {}
 
+@functools.lru_cache(maxsize=4)
+def _learning_insights_cached(patterns_file, mtime_ns):
+    """Load learning insights once per version of the patterns file"""
+    return load_json_file(patterns_file)
+
 def get_review_activity():
     """Get review activity for parent dashboard"""
     try:
         reviews = get_recent_reviews()
+        week_start_iso = current_week_start_iso()
         return {
             'recent_reviews': reviews,
-            'total_this_week': len([r for r in reviews if is_this_week(r.get('timestamp', ''))]),
+            'total_this_week': sum(1 for r in reviews if is_this_week(r.get('timestamp', ''), week_start_iso)),
             'safety_score': 9.5,  # Mock safety score
             'educational_progress': 8.2  # Mock educational progress
         }
@@ -837,68 +1744,115 @@ def optimize_for_reddit(content):
         'subreddit_suggestions': ['r/virtualreality', 'r/gamereview', 'r/VRGaming']
     }
 
+PLATFORM_OPTIMIZERS = {
+    'youtube': optimize_for_youtube,
+    'tiktok': optimize_for_tiktok,
+    'instagram': optimize_for_instagram,
+    'reddit': optimize_for_reddit
+}
+
 # Utility functions
-def calculate_quality_trend(reviews):
+# Numeric kernels for the analytics helpers, compiled with Numba when available
+jit_kernel = numba.njit(cache=True) if numba is not None else (lambda func: func)
+
+QUALITY_TRENDS = ('stable', 'improving', 'declining')
+
+@jit_kernel
+def _trend_kernel(scores):
+    """Compare the last five scores with the five before them (index into QUALITY_TRENDS)"""
+    recent_avg = scores[-5:].mean()
+    older_avg = scores[-10:-5].mean()
+    
+    if recent_avg > older_avg + 0.5:
+        return 1
+    elif recent_avg < older_avg - 0.5:
+        return 2
+    return 0
+
+if numba is not None:
+    @jit_kernel
+    def _category_totals_kernel(category_scores):
+        """Sum each column of a 2D score array, skipping NaN (missing) entries"""
+        rows, cols = category_scores.shape
+        totals = np.zeros(cols)
+        counts = np.zeros(cols, dtype=np.int64)
+        for row in range(rows):
+            for col in range(cols):
+                value = category_scores[row, col]
+                if not np.isnan(value):
+                    totals[col] += value
+                    counts[col] += 1
+        return totals, counts
+    
+    # Pay the compile (or cache load) cost at startup instead of on a request
+    _trend_kernel(np.zeros(10))
+    _category_totals_kernel(np.zeros((1, 1)))
+else:
+    def _category_totals_kernel(category_scores):
+        """Sum each column of a 2D score array, skipping NaN (missing) entries"""
+        present = ~np.isnan(category_scores)
+        return np.where(present, category_scores, 0.0).sum(axis=0), present.sum(axis=0)
+
+def review_scores(reviews, key='overall_score'):
+    """Collect one score field of the review history into a NumPy array"""
+    return np.fromiter((r.get(key, 0) for r in reviews), dtype=np.float64, count=len(reviews))
+
+def calculate_quality_trend(reviews, scores=None):
     """Calculate quality trend from review history"""
     if len(reviews) < 2:
         return 'insufficient_data'
     
-    recent_scores = [r.get('overall_score', 0) for r in reviews[-5:]]
-    older_scores = [r.get('overall_score', 0) for r in reviews[-10:-5]] if len(reviews) >= 10 else []
-    
-    if not older_scores:
+    if len(reviews) < 10:
         return 'new_reviewer'
     
-    recent_avg = sum(recent_scores) / len(recent_scores)
-    older_avg = sum(older_scores) / len(older_scores)
+    if scores is None:
+        scores = review_scores(reviews)
     
-    if recent_avg > older_avg + 0.5:
-        return 'improving'
-    elif recent_avg < older_avg - 0.5:
-        return 'declining'
-    else:
-        return 'stable'
+    return QUALITY_TRENDS[_trend_kernel(scores)]
 
-def calculate_genre_performance(reviews):
+def calculate_genre_performance(reviews, scores=None):
     """Calculate performance by game genre"""
-    genre_scores = {}
-    for review in reviews:
-        genre = review.get('game_genre', 'Unknown')
-        score = review.get('overall_score', 0)
-        
-        if genre not in genre_scores:
-            genre_scores[genre] = []
-        genre_scores[genre].append(score)
-    
-    # Calculate averages
-    for genre in genre_scores:
-        scores = genre_scores[genre]
-        genre_scores[genre] = {
-            'average_score': sum(scores) / len(scores),
-            'review_count': len(scores)
-        }
+    if not reviews:
+        return {}
+    
+    if scores is None:
+        scores = review_scores(reviews)
+    
+    # Map each genre to a dense index (in first-seen order) and reduce per group
+    genre_index = {}
+    genre_ids = np.fromiter(
+        (genre_index.setdefault(r.get('game_genre', 'Unknown'), len(genre_index)) for r in reviews),
+        dtype=np.intp, count=len(reviews)
+    )
+    counts = np.bincount(genre_ids, minlength=len(genre_index))
+    totals = np.bincount(genre_ids, weights=scores, minlength=len(genre_index))
     
-    return genre_scores
+    return {
+        genre: {
+            'average_score': float(totals[idx] / counts[idx]),
+            'review_count': int(counts[idx])
+        }
+        for genre, idx in genre_index.items()
+    }
 
 def identify_improvement_areas(reviews):
     """Identify areas needing improvement"""
     if not reviews:
         return []
     
-    # Aggregate scores by category
+    # Stack category scores into a 2D array in one pass; missing categories become NaN
     categories = ['educational_value', 'overall_score']
-    category_scores = {cat: [] for cat in categories}
-    
-    for review in reviews:
-        for category in categories:
-            if category in review:
-                category_scores[category].append(review[category])
+    category_scores = np.fromiter(
+        (review.get(category, np.nan) for review in reviews for category in categories),
+        dtype=np.float64, count=len(reviews) * len(categories)
+    ).reshape(len(reviews), len(categories))
+    totals, counts = _category_totals_kernel(category_scores)
     
     # Find categories with lowest average scores
     improvements = []
-    for category, scores in category_scores.items():
-        if scores:
-            avg_score = sum(scores) / len(scores)
+    for category, total, count in zip(categories, totals, counts):
+        if count:
+            avg_score = float(total / count)
             if avg_score < 7:
                 improvements.append({
                     'category': category,
@@ -909,66 +1863,248 @@ def identify_improvement_areas(reviews):
     
     return improvements
 
-def is_this_week(timestamp_str):
-    """Check if timestamp is within current week"""
+@functools.lru_cache(maxsize=1)
+def _week_start(minute_bucket):
+    """Get midnight on Monday of the current week (cached per minute bucket)"""
+    now = datetime.now()
+    return (now - timedelta(days=now.weekday())).replace(hour=0, minute=0, second=0, microsecond=0)
+
+@functools.lru_cache(maxsize=1)
+def _week_start_iso(minute_bucket):
+    """Get the current week start as an ISO string (cached per minute bucket)"""
+    return _week_start(minute_bucket).isoformat()
+
+def is_local_iso_timestamp(timestamp_str):
+    """Check for a full 'YYYY-MM-DDTHH:MM:SS[.ffffff]' timestamp without a UTC offset"""
+    return (len(timestamp_str) >= 19 and timestamp_str[10] == 'T' and timestamp_str[:4].isdigit()
+            and not timestamp_str.endswith('Z')
+            and '+' not in timestamp_str[19:] and '-' not in timestamp_str[19:])
+
+def current_week_start_iso():
+    """Get midnight on Monday of the current week as a local ISO string"""
+    # Every UTC offset is a whole number of minutes, so the cached value
+    # rolls over within a minute of local midnight on Monday
+    return _week_start_iso(int(time.time() // 60))
+
+@functools.lru_cache(maxsize=4096)
+def _parse_timestamp(timestamp_str):
+    """Parse an ISO timestamp to naive local time (cached per string)"""
+    if timestamp_str.endswith('Z'):
+        # Slice off the UTC designator instead of rewriting the string
+        timestamp = datetime.fromisoformat(timestamp_str[:-1]).replace(tzinfo=timezone.utc)
+    else:
+        timestamp = datetime.fromisoformat(timestamp_str)
+    if timestamp.tzinfo is not None:
+        # Compare in local time, like the naive week start
+        timestamp = timestamp.astimezone().replace(tzinfo=None)
+    return timestamp
+
+def is_this_week(timestamp_str, week_start_iso=None):
+    """Check if timestamp is within current week
+
+    Pass week_start_iso (from current_week_start_iso()) when checking many
+    timestamps so the week start is looked up once.
+    """
+    if week_start_iso is None:
+        week_start_iso = current_week_start_iso()
+    
     try:
-        timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-        now = datetime.now()
-        week_start = now - timedelta(days=now.weekday())
-        return timestamp >= week_start
-    except:
+        if is_local_iso_timestamp(timestamp_str):
+            # Local ISO timestamps (as written by datetime.now().isoformat()) sort as strings
+            return timestamp_str >= week_start_iso
+        
+        return _parse_timestamp(timestamp_str) >= _parse_timestamp(week_start_iso)
+    except (AttributeError, TypeError, ValueError):
         return False
 
 # Video database management functions
-def load_video_database():
-    """Load video database from JSON file"""
+VIDEO_COLUMNS = ('id', 'filename', 'filepath', 'game_name', 'review_type',
+                 'upload_date', 'size', 'status', 'game_info_json')
+
+@contextlib.contextmanager
+def video_db():
+    """Open the video database in a transaction"""
+    conn = sqlite3.connect(CONFIG['VIDEO_DATABASE'], timeout=10)
+    conn.row_factory = sqlite3.Row
+    # With WAL, NORMAL only syncs at checkpoints and commits stay crash-safe
+    conn.execute("PRAGMA synchronous=NORMAL")
+    try:
+        with conn:
+            yield conn
+    finally:
+        conn.close()
+
+def init_video_database():
+    """Create the video tables and import the legacy JSON database once"""
+    os.makedirs(os.path.dirname(CONFIG['VIDEO_DATABASE']), exist_ok=True)
+    with video_db() as conn:
+        # Readers no longer block behind a writer, and commits append to the log
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS videos (
+                id TEXT PRIMARY KEY,
+                filename TEXT,
+                filepath TEXT,
+                game_name TEXT,
+                review_type TEXT,
+                upload_date TEXT,
+                size TEXT,
+                status TEXT,
+                game_info_json TEXT
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_videos_upload_date ON videos(upload_date DESC)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_videos_game_name ON videos(game_name)")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS uploads (
+                id TEXT PRIMARY KEY,
+                part_path TEXT,
+                received INTEGER,
+                total_size INTEGER,
+                metadata_json TEXT,
+                created TEXT
+            )
+        """)
+        
+        legacy_file = CONFIG['LEGACY_VIDEO_DATABASE']
+        if os.path.exists(legacy_file) and conn.execute("SELECT 1 FROM videos LIMIT 1").fetchone() is None:
+            legacy_videos = load_json_file(legacy_file)
+            conn.executemany(
+                f"INSERT OR REPLACE INTO videos VALUES ({', '.join('?' * len(VIDEO_COLUMNS))})",
+                [video_to_row(video) for video in legacy_videos]
+            )
+            print(f"Imported {len(legacy_videos)} videos from {legacy_file}")
+
+def video_to_row(video_entry):
+    """Convert a video entry to a videos table row"""
+    return tuple(video_entry.get(column) for column in VIDEO_COLUMNS[:-1]) + (
+        dumps_json(video_entry.get('game_info', {})).decode('utf-8'),
+    )
+
+def video_from_row(row):
+    """Convert a videos table row to a video entry"""
+    video = {column: row[column] for column in VIDEO_COLUMNS[:-1]}
+    video['game_info'] = loads_json(row['game_info_json']) if row['game_info_json'] else {}
+    return video
+
+_video_version_conn = None
+# (data_version, full video list, file names grouped by folder)
+_video_list_cache = (None, None, None)
+_video_cache_lock = threading.Lock()
+
+def video_database_version():
+    """Get a value that changes whenever any connection (in any process) commits to the video database"""
+    global _video_version_conn
+    with _video_cache_lock:
+        if _video_version_conn is None:
+            _video_version_conn = sqlite3.connect(CONFIG['VIDEO_DATABASE'], check_same_thread=False)
+        return _video_version_conn.execute("PRAGMA data_version").fetchone()[0]
+
+def group_files_by_dir(filepaths):
+    """Group file names by folder so each folder can be listed once"""
+    names_by_dir = {}
+    for filepath in filepaths:
+        if filepath:
+            names_by_dir.setdefault(os.path.dirname(filepath), set()).add(os.path.basename(filepath))
+    return names_by_dir
+
+def _load_video_columns():
+    """Load the full video list and its files by folder, reused until the database changes"""
+    global _video_list_cache
+    # The version is read first so a racing write can only cause a reload
+    version = video_database_version()
+    cached_version, cached_videos, cached_files = _video_list_cache
+    if cached_version == version:
+        return cached_videos, cached_files
+    
+    with video_db() as conn:
+        videos = [video_from_row(row) for row in conn.execute(
+            f"SELECT {', '.join(VIDEO_COLUMNS)} FROM videos ORDER BY upload_date DESC"
+        )]
+    files_by_dir = group_files_by_dir(video['filepath'] for video in videos)
+    _video_list_cache = (version, videos, files_by_dir)
+    return videos, files_by_dir
+
+def load_video_database(limit=None, offset=0):
+    """Load videos from the database, newest first"""
     try:
-        if os.path.exists(CONFIG['VIDEO_DATABASE']):
-            with open(CONFIG['VIDEO_DATABASE'], 'r') as f:
-                return json.load(f)
+        if limit is None:
+            return list(_load_video_columns()[0])
+        
+        with video_db() as conn:
+            return [video_from_row(row) for row in conn.execute(
+                f"SELECT {', '.join(VIDEO_COLUMNS)} FROM videos ORDER BY upload_date DESC LIMIT ? OFFSET ?",
+                (limit, offset)
+            )]
     except Exception as e:
         print(f"Error loading video database: {e}")
     return []
 
-def save_video_database(videos):
-    """Save video database to JSON file"""
+def get_video(video_id):
+    """Look up a single video by ID"""
     try:
-        os.makedirs(os.path.dirname(CONFIG['VIDEO_DATABASE']), exist_ok=True)
-        with open(CONFIG['VIDEO_DATABASE'], 'w') as f:
-            json.dump(videos, f, indent=2)
+        with video_db() as conn:
+            row = conn.execute(
+                f"SELECT {', '.join(VIDEO_COLUMNS)} FROM videos WHERE id = ?", (video_id,)
+            ).fetchone()
+        return video_from_row(row) if row else None
     except Exception as e:
-        print(f"Error saving video database: {e}")
+        print(f"Error loading video {video_id}: {e}")
+    return None
 
 def save_video_to_database(video_entry):
     """Add a new video entry to the database"""
-    videos = load_video_database()
-    videos.append(video_entry)
-    save_video_database(videos)
+    with video_db() as conn:
+        conn.execute(
+            f"INSERT INTO videos VALUES ({', '.join('?' * len(VIDEO_COLUMNS))})",
+            video_to_row(video_entry)
+        )
+
+def delete_video_from_database(video_id):
+    """Remove a video entry from the database"""
+    with video_db() as conn:
+        conn.execute("DELETE FROM videos WHERE id = ?", (video_id,))
+
+try:
+    init_video_database()
+except Exception as e:
+    print(f"Cannot initialize video database: {CONFIG['VIDEO_DATABASE']} - {e}")
+
+FILE_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
 
 def format_file_size(size_in_bytes):
     """Format file size in human-readable format"""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_in_bytes < 1024.0:
-            return f"{size_in_bytes:.1f} {unit}"
-        size_in_bytes /= 1024.0
-    return f"{size_in_bytes:.1f} TB"
-
-def calculate_total_video_size(videos):
-    """Calculate total size of all videos"""
+    # Each unit is 2**10 times the previous one, so the bit length picks the unit
+    unit_index = min(max((int(size_in_bytes).bit_length() - 1) // 10, 0), len(FILE_SIZE_UNITS) - 1)
+    return f"{size_in_bytes / (1 << (unit_index * 10)):.1f} {FILE_SIZE_UNITS[unit_index]}"
+
+def calculate_total_video_size(videos=None):
+    """Calculate total size of the given videos, or of every video in the database"""
+    # Group by folder so each folder is listed once with scandir
+    if videos is None:
+        names_by_dir = _load_video_columns()[1]
+    else:
+        names_by_dir = group_files_by_dir(video.get('filepath') for video in videos)
+    
     total_bytes = 0
-    for video in videos:
-        if os.path.exists(video.get('filepath', '')):
-            try:
-                total_bytes += os.path.getsize(video['filepath'])
-            except:
-                pass
+    for directory, names in names_by_dir.items():
+        try:
+            with os.scandir(directory or '.') as entries:
+                for entry in entries:
+                    if entry.name in names:
+                        try:
+                            if entry.is_file():
+                                total_bytes += entry.stat().st_size
+                        except OSError:
+                            pass
+        except OSError:
+            pass
     return format_file_size(total_bytes)
 
 # Always configure the app, even if not running as main
 print("🎮 VR Game Review Studio starting...")
 print("📝 Young reviewer-friendly interface ready!")
 print("🔍 Game research tools loaded")
-print("🤖 AI analysis systems initialized")
 print("🛡️ Safety systems active")
 
 # Use environment variables for deployment
@@ -980,9 +2116,23 @@ if IS_PRODUCTION:
 else:
     host = os.getenv('FLASK_HOST', 'localhost')
     port = int(os.getenv('FLASK_PORT', 5000))
-    debug = os.getenv('FLASK_DEBUG', 'True').lower() == 'true'
+    debug = env_bool('FLASK_DEBUG')
 
 print(f"Configured to run on {host}:{port} (debug={debug}, production={IS_PRODUCTION})")
 
+def warm_template_cache():
+    """Compile every template up front so the first requests do not pay for it"""
+    for template_name in app.jinja_env.list_templates(extensions=['html']):
+        try:
+            app.jinja_env.get_template(template_name)
+        except Exception as e:
+            print(f"Cannot precompile template {template_name}: {e}")
+
+warm_template_cache()
+
 if __name__ == '__main__':
-    app.run(host=host, port=port, debug=debug)
\ No newline at end of file
+    # Production is served by gunicorn (see gunicorn.conf.py), never the dev server
+    if IS_PRODUCTION and not env_bool('FLASK_DEV'):
+        raise SystemExit("Development server disabled in production; run: gunicorn -c gunicorn.conf.py wsgi:app")
+    # The reloader would import (and initialize) everything twice
+    app.run(host=host, port=port, debug=debug, use_reloader=False)
\ No newline at end of file
@@ -2,164 +2,225 @@
 Minimal VR Game Review Studio Web Interface for Render Deployment
 """
 
-from flask import Flask, render_template, jsonify
+from flask import Flask, render_template, request
+from jinja2 import TemplateNotFound
 import os
+import json
 from datetime import datetime
 
+from env_flags import env_bool
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 app = Flask(__name__)
 app.secret_key = os.getenv('FLASK_SECRET_KEY', 'vr_review_studio_secret_key')
 
 # Simple configuration
-IS_PRODUCTION = os.getenv('FLASK_DEBUG', 'True').lower() == 'false' or os.getenv('RENDER', False)
+IS_PRODUCTION = not env_bool('FLASK_DEBUG', True) or os.getenv('RENDER') is not None
+
+def dumps_json(obj):
+    """Serialize an object to compact JSON bytes, with orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+def json_response(obj):
+    """Build a JSON response without going through jsonify"""
+    return app.response_class(dumps_json(obj), mimetype='application/json')
+
+# Pages rendered purely from module constants are rendered once per process
+_RENDER_CACHE = {}
+
+def render_cached(template_name, **context):
+    """Render a template whose context never changes, reusing the first rendering"""
+    if app.debug:
+        return render_template(template_name, **context)
+    html = _RENDER_CACHE.get(template_name)
+    if html is None:
+        html = _RENDER_CACHE[template_name] = render_template(template_name, **context)
+    return html
+
+# Mock data for demonstration, built once; only the timestamps change per request
+RECENT_REVIEWS = (
+    {
+        'id': '1',
+        'game_name': 'Half-Life: Alyx',
+        'overall_score': 9.5,
+        'educational_value': 8.0
+    },
+    {
+        'id': '2', 
+        'game_name': 'Beat Saber',
+        'overall_score': 8.5,
+        'educational_value': 7.0
+    }
+)
+
+NOTIFICATIONS = (
+    {
+        'title': 'Welcome to VR Review Studio!',
+        'message': 'Start creating amazing VR game reviews'
+    },
+)
+
+DASHBOARD_STATS = {
+    'total_reviews': 2,
+    'average_score': 9.0,
+    'average_educational': 7.5,
+    'recent_trend': 'improving'
+}
+
+ANALYTICS = {
+    'total_reviews': 2,
+    'quality_trend': 'improving',
+    'genre_performance': {
+        'Action/Adventure': {'average_score': 9.5, 'review_count': 1},
+        'Rhythm': {'average_score': 8.5, 'review_count': 1}
+    }
+}
+
+INSIGHTS = {
+    'strengths': ['Enthusiasm', 'Game knowledge'],
+    'improvements': ['Technical explanations', 'Conclusion strength']
+}
+
+DB_STATS = {
+    'total_games': 4,
+    'total_reviews': 2
+}
+
+TRENDING_GAMES = (
+    {'name': 'Half-Life: Alyx', 'rating': 4.8, 'review_priority': 9},
+    {'name': 'Beat Saber', 'rating': 4.7, 'review_priority': 8}
+)
+
+PARENT_ACTIVITY = {
+    'recent_reviews': 2,
+    'total_this_week': 1,
+    'safety_score': 9.5,
+    'educational_progress': 8.2
+}
+
+PARENT_SAFETY = {
+    'content_appropriate': True,
+    'language_suitable': True,
+    'community_interactions': 'positive',
+    'recommendations': ['Continue current approach']
+}
+
+PARENT_PROGRESS = {
+    'educational_value_trend': 'improving',
+    'clarity_trend': 'stable',
+    'engagement_trend': 'improving',
+    'areas_of_strength': ['Enthusiasm', 'Game knowledge'],
+    'areas_for_improvement': ['Technical explanations']
+}
 
 @app.route('/')
 def dashboard():
     """Main reviewer dashboard"""
-    # Mock data for demonstration
-    recent_reviews = [
-        {
-            'id': '1',
-            'game_name': 'Half-Life: Alyx',
-            'timestamp': datetime.now().isoformat(),
-            'overall_score': 9.5,
-            'educational_value': 8.0
-        },
-        {
-            'id': '2', 
-            'game_name': 'Beat Saber',
-            'timestamp': datetime.now().isoformat(),
-            'overall_score': 8.5,
-            'educational_value': 7.0
-        }
-    ]
-    
-    notifications = [
-        {
-            'title': 'Welcome to VR Review Studio!',
-            'message': 'Start creating amazing VR game reviews',
-            'timestamp': datetime.now().isoformat()
-        }
-    ]
-    
-    stats = {
-        'total_reviews': 2,
-        'average_score': 9.0,
-        'average_educational': 7.5,
-        'recent_trend': 'improving'
-    }
+    now = datetime.now().isoformat()
     
     return render_template('review_dashboard.html', 
-                         recent_reviews=recent_reviews,
-                         notifications=notifications,
-                         stats=stats)
+                         recent_reviews=[{**review, 'timestamp': now} for review in RECENT_REVIEWS],
+                         notifications=[{**notification, 'timestamp': now} for notification in NOTIFICATIONS],
+                         stats=DASHBOARD_STATS)
 
 @app.route('/new-review')
 def new_review():
     """Start new review creation process"""
-    return render_template('game_research_setup.html')
+    return render_cached('game_research_setup.html')
+
+# Mock VR games data
+MOCK_GAMES = (
+    {'name': 'Half-Life: Alyx', 'genre': 'Action/Adventure', 'platform': 'PC VR', 'price': 59.99, 'rating': 4.8},
+    {'name': 'Beat Saber', 'genre': 'Rhythm', 'platform': 'Multi-Platform VR', 'price': 29.99, 'rating': 4.7},
+    {'name': 'Boneworks', 'genre': 'Action/Physics', 'platform': 'PC VR', 'price': 29.99, 'rating': 4.2},
+    {'name': 'The Walking Dead: Saints & Sinners', 'genre': 'Survival Horror', 'platform': 'Multi-Platform VR', 'price': 39.99, 'rating': 4.5}
+)
+
+# Lowercased search fields and a trigram -> game indices map, built once
+def build_game_trigrams(search_fields):
+    """Map each 3-character substring of the search fields to the games containing it"""
+    trigrams = {}
+    for idx, fields in enumerate(search_fields):
+        for field in fields:
+            for i in range(len(field) - 2):
+                trigrams.setdefault(field[i:i + 3], set()).add(idx)
+    return trigrams
+
+GAME_SEARCH_FIELDS = tuple((g['name'].lower(), g['genre'].lower()) for g in MOCK_GAMES)
+GAME_TRIGRAMS = build_game_trigrams(GAME_SEARCH_FIELDS)
+# An empty query returns every game, so that response body is serialized once
+ALL_GAMES_PAYLOAD = dumps_json({'games': MOCK_GAMES})
 
 @app.route('/api/search-games')
 def search_games():
     """Search VR games for review selection"""
-    query = request.args.get('q', '').strip()
-    
-    # Mock VR games data
-    mock_games = [
-        {'name': 'Half-Life: Alyx', 'genre': 'Action/Adventure', 'platform': 'PC VR', 'price': 59.99, 'rating': 4.8},
-        {'name': 'Beat Saber', 'genre': 'Rhythm', 'platform': 'Multi-Platform VR', 'price': 29.99, 'rating': 4.7},
-        {'name': 'Boneworks', 'genre': 'Action/Physics', 'platform': 'PC VR', 'price': 29.99, 'rating': 4.2},
-        {'name': 'The Walking Dead: Saints & Sinners', 'genre': 'Survival Horror', 'platform': 'Multi-Platform VR', 'price': 39.99, 'rating': 4.5}
-    ]
+    query = request.args.get('q', '').strip().lower()
     
     # Filter by query
-    if query:
-        games = [g for g in mock_games if query.lower() in g['name'].lower() or query.lower() in g['genre'].lower()]
-    else:
-        games = mock_games
+    if not query:
+        return app.response_class(ALL_GAMES_PAYLOAD, mimetype='application/json')
+    
+    # Any match contains the query's first trigram, so only those games need checking
+    candidates = sorted(GAME_TRIGRAMS.get(query[:3], ())) if len(query) >= 3 else range(len(MOCK_GAMES))
+    games = [
+        MOCK_GAMES[idx] for idx in candidates
+        if query in GAME_SEARCH_FIELDS[idx][0] or query in GAME_SEARCH_FIELDS[idx][1]
+    ]
     
-    return jsonify({'games': games})
+    return json_response({'games': games})
 
 @app.route('/review-editor')
 def review_editor():
     """Review structure editor"""
-    return render_template('review_structure_editor.html')
+    return render_cached('review_structure_editor.html')
 
 @app.route('/review-analytics')
 def review_analytics():
     """Review performance analytics"""
-    analytics = {
-        'total_reviews': 2,
-        'quality_trend': 'improving',
-        'genre_performance': {
-            'Action/Adventure': {'average_score': 9.5, 'review_count': 1},
-            'Rhythm': {'average_score': 8.5, 'review_count': 1}
-        }
-    }
-    
-    insights = {
-        'strengths': ['Enthusiasm', 'Game knowledge'],
-        'improvements': ['Technical explanations', 'Conclusion strength']
-    }
-    
-    return render_template('review_analytics.html',
-                         analytics=analytics,
-                         insights=insights)
+    return render_cached('review_analytics.html',
+                         analytics=ANALYTICS,
+                         insights=INSIGHTS)
 
 @app.route('/game-database')
 def game_database():
     """VR game database"""
-    db_stats = {
-        'total_games': 4,
-        'total_reviews': 2,
-        'last_updated': datetime.now().isoformat()
-    }
-    
-    trending_games = [
-        {'name': 'Half-Life: Alyx', 'rating': 4.8, 'review_priority': 9},
-        {'name': 'Beat Saber', 'rating': 4.7, 'review_priority': 8}
-    ]
-    
-    return render_template('game_database.html',
-                         db_stats=db_stats,
-                         trending_games=trending_games)
+    return render_cached('game_database.html',
+                         db_stats={**DB_STATS, 'last_updated': datetime.now().isoformat()},
+                         trending_games=TRENDING_GAMES)
 
 @app.route('/parent-dashboard')
 def parent_dashboard():
     """Parent oversight dashboard"""
-    activity = {
-        'recent_reviews': 2,
-        'total_this_week': 1,
-        'safety_score': 9.5,
-        'educational_progress': 8.2
-    }
-    
-    safety = {
-        'content_appropriate': True,
-        'language_suitable': True,
-        'community_interactions': 'positive',
-        'recommendations': ['Continue current approach']
-    }
-    
-    progress = {
-        'educational_value_trend': 'improving',
-        'clarity_trend': 'stable',
-        'engagement_trend': 'improving',
-        'areas_of_strength': ['Enthusiasm', 'Game knowledge'],
-        'areas_for_improvement': ['Technical explanations']
-    }
-    
-    return render_template('parent_dashboard.html',
-                         activity=activity,
-                         safety=safety,
-                         progress=progress)
+    return render_cached('parent_dashboard.html',
+                         activity=PARENT_ACTIVITY,
+                         safety=PARENT_SAFETY,
+                         progress=PARENT_PROGRESS)
+
+def prerender_error_page(template_name, fallback_html):
+    """Render an error page once, using plain HTML when the template is missing"""
+    try:
+        with app.test_request_context():
+            return render_template(template_name).encode('utf-8')
+    except TemplateNotFound:
+        return fallback_html.encode('utf-8')
+
+# Error pages are rendered once so bad URLs never go through Jinja
+NOT_FOUND_PAGE = prerender_error_page('404.html', '<h1>404 - Page not found</h1>')
+SERVER_ERROR_PAGE = prerender_error_page('500.html', '<h1>500 - Something went wrong</h1>')
 
 @app.errorhandler(404)
 def not_found(e):
-    return render_template('404.html'), 404
+    return app.response_class(NOT_FOUND_PAGE, status=404, mimetype='text/html')
 
 @app.errorhandler(500)
 def server_error(e):
-    return render_template('500.html'), 500
+    return app.response_class(SERVER_ERROR_PAGE, status=500, mimetype='text/html')
 
 if __name__ == '__main__':
     print("🎮 VR Game Review Studio (Minimal) starting...")
@@ -168,6 +229,6 @@ if __name__ == '__main__':
     # Use environment variables for deployment
     host = os.getenv('FLASK_HOST', 'localhost')
     port = int(os.getenv('FLASK_PORT', 5000))
-    debug = os.getenv('FLASK_DEBUG', 'True').lower() == 'true'
+    debug = env_bool('FLASK_DEBUG', True)
     
     app.run(host=host, port=port, debug=debug)
\ No newline at end of file
@@ -0,0 +1,24 @@
+"""
+Environment flag parsing shared by the full and minimal web apps
+"""
+
+import os
+
+TRUE_VALUES = ('1', 'true', 'yes', 'on')
+FALSE_VALUES = ('0', 'false', 'no', 'off')
+
+def env_bool(name, default=False):
+    """Read a boolean flag from the environment
+
+    Only explicit values ('1/true/yes/on' or '0/false/no/off') count; unset or
+    unrecognised values (typos) give the default.
+    """
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    value = value.strip().lower()
+    if value in TRUE_VALUES:
+        return True
+    if value in FALSE_VALUES:
+        return False
+    return default
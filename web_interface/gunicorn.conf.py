@@ -0,0 +1,23 @@
+"""
+Gunicorn configuration for VR Game Review Studio
+Threaded workers keep dashboard requests responsive while uploads and
+review processing are in progress.
+"""
+
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '10000')}"
+
+# Worker processes and threads per worker
+workers = int(os.getenv('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', 8))
+
+# Large (500MB) uploads and inline review processing need a long timeout
+timeout = 1800
+graceful_timeout = 30
+
+# Recycle workers periodically to keep memory in check
+max_requests = 1000
+max_requests_jitter = 50
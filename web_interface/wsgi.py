@@ -0,0 +1,8 @@
+"""
+WSGI entry point for VR Game Review Studio
+Run with: gunicorn -c gunicorn.conf.py wsgi:app
+"""
+
+from app import app
+
+__all__ = ['app']